@@ -13,15 +13,22 @@
 # It will not run properly outside of Golly.
 # https://golly.sourceforge.io/
 #
+# NOTE: the Python used by Golly needs NumPy and Numba.
+# https://numba.pydata.org/
+#
 #
 #
 # IMPORT
 # ======
 #
 import golly
+import os
 import numpy as np
-import random as rand
-import copy
+from numba import njit, prange
+#
+# - a single NumPy random number generator for the whole run
+#
+rng = np.random.default_rng()
 #
 #
 # EXPERIMENT SETTINGS
@@ -53,9 +60,48 @@ prob_mutation    = 0.1        # probability of switching among white and black
 prob_selection   = 0.6        # probability of adding a fit seed and dropping unfit
 seed_size        = 30         # 30x30 grid
 adult_size       = 60         # 60x60 grid
+num_islands      = 1          # number of Golly instances evolving side by side
+island_number    = 0          # this instance: 0, 1, ..., num_islands - 1
+migration_births = 1000       # births between migrations among islands
+show_births      = 1000       # births between progress messages in Golly
+#
+# - ISLANDS: to use several cores, run num_islands copies of this
+#   script at the same time, each in its own Golly instance, in the
+#   same directory, and each with its own island_number
+# - each island evolves its own population; every migration_births
+#   births, an island saves its most fit seed in a file and replaces
+#   its least fit organism with the most fit seed of the previous
+#   island (island_number - 1), so the islands form a ring
+# - with num_islands = 1 there is no migration
+# - the seeds are exchanged through files named "island<T>_<k>.npy"
+#   (T = target_number, k = island_number); an island removes only
+#   its own file when it starts, so remove all of the old island
+#   files before launching the islands, or an island that starts
+#   early may import a seed left over from an earlier run
+#
+# - the file through which an island sends its most fit seed to the
+#   next island in the ring
+def island_file_name(island):
+  return "./island" + str(target_number) + "_" + str(island) + ".npy"
+#
+# - each island keeps its own log file and photos
+if (num_islands == 1):
+  run_name = str(target_number)
+else:
+  run_name = str(target_number) + "_island" + str(island_number)
+#
+# - the log file is opened once for the whole run and closed after
+#   the final report
+# - it is flushed after each group of lines, so the log is complete
+#   up to that point even if the run is stopped early
+log_file = open("./log_file" + run_name + ".txt", "a+")
+#
+# - remove the seed this island saved in an earlier run, before the
+#   next island can import it
+if (num_islands > 1) and os.path.exists(island_file_name(island_number)):
+  os.remove(island_file_name(island_number))
 #
 # - record the settings
-log_file = open("./log_file" + str(target_number) + ".txt", "a+")
 log_file.write("\n" + \
   "rule_name        = " + str(rule_name)       + "\n" + \
   "target number    = " + str(target_number)   + "\n" + \
@@ -68,8 +114,11 @@ log_file.write("\n" + \
   "prob_mutation    = " + str(prob_mutation)   + "\n" + \
   "prob_selection   = " + str(prob_selection)  + "\n" + \
   "seed_size        = " + str(seed_size)       + "\n" + \
-  "adult_size       = " + str(adult_size)      + "\n")
-log_file.close()
+  "adult_size       = " + str(adult_size)      + "\n" + \
+  "num_islands      = " + str(num_islands)     + "\n" + \
+  "island_number    = " + str(island_number)   + "\n" + \
+  "migration_births = " + str(migration_births) + "\n")
+log_file.flush()
 #
 #
 # COLOURS
@@ -80,14 +129,19 @@ log_file.close()
 white = 0
 black = 1
 #
+# - the other colour, indexed by colour:
+#   other_colour[white] = black, other_colour[black] = white
+#
+other_colour = np.array([black, white], dtype=np.int8)
+#
 #
 # ALGORITHM
 # =========
 #
 # Algorithm = random mutation and/or evolutionary algorithm
 #
-# - "mutate_seed(seed_matrix, prob_mutation)"
-# - "select_seed(seed_matrix, prob_selection)"
+# - "mutate_and_select_seed(seeds, fits, population_size, sample_size,
+#   prob_mutation)"
 #
 # - mutation only: prob_mutation = 0.2, prob_selection = 0.0
 # - selection only: prob_mutation = 0.0, prob_selection = 0.2
@@ -105,13 +159,32 @@ black = 1
 # - square gene should be placed in middle of 60x60 matrix
 #
 #
+# RANDOM NUMBER POOL
+# ==================
+#
+# - each birth needs sample_size + 2 random positions and two random
+#   numbers per seed cell
+# - rather than asking the generator for these at every birth, they
+#   are drawn for pool_size births at a time and used up one birth
+#   at a time (see "next_random_numbers()")
+# - uniform_pool holds float32 numbers, half the size of float64
+#
+pool_size    = 1024
+sample_pool  = None
+uniform_pool = None
+pool_index   = pool_size   # the pool starts out used up
+#
+#
 #
 # FUNCTIONS
 # =========
 #
-# Make a random seed matrix.
+# Make a batch of random seed matrices. The seeds are independent
+# of each other, so they are made in parallel. The output has the
+# shape num_seeds x seed_size x seed_size.
 #
-def make_seed_matrix(prob_white, prob_black, seed_size):
+@njit(parallel=True)
+def make_seed_batch(num_seeds, prob_white, prob_black, seed_size):
   # - seed_size setting = size of the seed = 20 or 40
   # - 20 -> 20x20
   # - 40 -> 40x40
@@ -123,47 +196,34 @@ def make_seed_matrix(prob_white, prob_black, seed_size):
   #   that the matrix is centered on the screen
   # - upper left  = <-10, -10>
   # - lower right = <+10, +10>
-  # - start with a matrix of zeros
-  seed_matrix = np.zeros([seed_size, seed_size], dtype=int)
   # - each colour is assigned an ID number
   white = 0
   black = 1
-  # - fill in the matrix
-  for i in range(seed_size):
-    for j in range(seed_size):
-      # - 0 = loss, 1 = win
-      # - assume loss for both white and black
-      white_state = 0
-      black_state = 0
-      # - flip a biased coin for white
-      if (rand.random() < prob_white):
-        white_state = 1
-      # - flip a biased coin for black
-      if (rand.random() < prob_black):
-        black_state = 1
-      # - what if there is a tie between white and black?
-      if ((white_state == 1) and (black_state == 1)):
-        # - it's a tie, so flip a coin
-        if (rand.random() < 0.5):
-          white_state = 0
-          black_state = 1
+  # - each cell behaves as if it flipped a biased coin for white, a
+  #   biased coin for black, and a fair coin to break a tie between
+  #   white and black
+  # - a cell is black when black wins outright, or when white and
+  #   black tie and the tie goes to black; otherwise (white wins, or
+  #   neither is selected) the cell is white (zero)
+  # - so one uniform random number per cell is enough: the cell is
+  #   black when the number falls below the total chance of black
+  p_black_only = prob_black * (1 - prob_white)
+  p_tie_black  = prob_black * prob_white * 0.5
+  cutoff_black = p_black_only + p_tie_black
+  seed_batch = np.empty((num_seeds, seed_size, seed_size), dtype=np.int8)
+  # - prange spreads the seeds over the available cores
+  for k in prange(num_seeds):
+    for i in range(seed_size):
+      for j in range(seed_size):
+        if (np.random.random() < cutoff_black):
+          seed_batch[k, i, j] = black
         else:
-          white_state = 1
-          black_state = 0
-      # - we've broken the tie
-      if (white_state == 1):
-        # - white == 1
-        seed_matrix[i, j] = white
-      if (black_state == 1):
-        # - black == 0
-        seed_matrix[i, j] = black
-      # - if neither white nor black was selected, then 
-      #   seed_matrix[i, j] is zero, since the seed_matrix is
-      #   initialized to zero (white)
-  return seed_matrix
+          seed_batch[k, i, j] = white
+  return seed_batch
 #
 # Given a seed matrix, write it on the Golly screen and let it grow.
-# The result is an adult matrix.
+# The result is an adult matrix. During the run, seeds are grown by
+# "grow_and_score()" instead; Golly is used for the photos.
 #
 def grow_matrix(seed_matrix, num_steps, adult_size):
   # - position the seed in the center of the grid
@@ -178,61 +238,187 @@ def grow_matrix(seed_matrix, num_steps, adult_size):
   black  = 1 # black,0,0,0
   golly.setcolors([white,255,255,255,black,0,0,0])
   # - write seed_matrix in the center of Golly screen
-  for i in range(seed_size):
-    for j in range(seed_size):
-      # - get the colour of this matrix cell
-      colour = seed_matrix[i][j]
-      # - write the colour on the Golly screen
-      # - center the 20x20 seed by moving up and left by seed_offset 10
-      # - center the 40x40 seed by moving up and left by seed_offset 20
-      golly.setcell(i - seed_offset, j - seed_offset, colour)
+  # - a new universe is all white, so only the black cells are written
+  # - center the 20x20 seed by moving up and left by seed_offset 10
+  # - center the 40x40 seed by moving up and left by seed_offset 20
+  # - the cells are passed to Golly as one flat list [x1, y1, x2, y2, ...],
+  #   so there is one call to Golly instead of one call per cell
+  live_cells = np.argwhere(seed_matrix == black) - seed_offset
+  golly.putcells(live_cells.ravel().tolist())
   # - run Golly until it grows to 60 x 60
   golly.run(num_steps)
   # - now make a box of 60 x 60 centered on the origin
   [left, top, width, height] = [-30, -30, 60, 60]
-  # - read the 60 x 60 box into a matrix
-  grown_matrix = np.zeros([height, width], dtype=int)
-  for i in range(height):
-    for j in range(width):
-      grown_matrix[i][j] = golly.getcell(i + left, j + top)
+  # - read the 60 x 60 box into a matrix with a single call to Golly
+  grown_matrix = np.zeros([height, width], dtype=np.int8)
+  cell_list = golly.getcells([left, top, width, height])
+  if (len(cell_list) % 2 == 0):
+    # - one-state cell list: [x1, y1, x2, y2, ...]
+    cells  = np.array(cell_list, dtype=int).reshape(-1, 2)
+    states = black
+  else:
+    # - multi-state cell list: [x1, y1, state1, ...], followed by a
+    #   padding 0 only when the list would otherwise have an even
+    #   length, so trim the list to a multiple of 3
+    num_values = len(cell_list) - len(cell_list) % 3
+    cells  = np.array(cell_list[:num_values], dtype=int).reshape(-1, 3)
+    states = cells[:, 2]
+  grown_matrix[cells[:, 0] - left, cells[:, 1] - top] = states
   # - output the new grown_matrix
   return grown_matrix
 #
-# Given a seed matrix, swap some of the colours (white, black).
-# This is a simple random mutation of the seed.
+# Given a Life-like rule on a torus, such as "B3/S45678:T60,60", make
+# two tables indexed by the number of black neighbours (0 to 8):
+# birth_table[n] is True when a white cell with n black neighbours
+# turns black, and survival_table[n] is True when a black cell with
+# n black neighbours stays black.
+#
+def parse_rule(rule_name, adult_size):
+  # - "run_life()" only knows the adult_size x adult_size torus
+  assert (":" in rule_name)
+  [rule, topology] = rule_name.split(":")
+  assert (topology == "T" + str(adult_size) + "," + str(adult_size))
+  # - the rule must be written as B.../S...
+  [births, survivals] = rule.upper().split("/")
+  assert (births[0] == "B") and (survivals[0] == "S")
+  birth_table    = np.zeros(9, dtype=np.bool_)
+  survival_table = np.zeros(9, dtype=np.bool_)
+  for n in births[1:]:
+    birth_table[int(n)] = True
+  for n in survivals[1:]:
+    survival_table[int(n)] = True
+  return [birth_table, survival_table]
+#
+# Run a Life-like rule for num_steps steps on a torus, in place, given
+# its packed rows (see "pack_rows()"). This is the same computation as
+# golly.run() on the T60,60 torus, without leaving Python.
+#
+@njit
+def run_life(rows, num_steps, birth_table, survival_table):
+  num_rows = len(rows)
+  # - the torus is square, so each row holds num_rows cells
+  one      = np.uint64(1)
+  last     = np.uint64(num_rows - 1)
+  mask     = (one << np.uint64(num_rows)) - one
+  new_rows = np.empty_like(rows)
+  for step in range(num_steps):
+    for i in range(num_rows):
+      # - the rows above and below wrap around the torus: row i - 1
+      #   of row 0 is row num_rows - 1, and the other way round
+      above = rows[(i - 1) % num_rows]
+      here  = rows[i]
+      below = rows[(i + 1) % num_rows]
+      # - the neighbours to the left and right wrap around the torus:
+      #   column j - 1 of column 0 is column num_rows - 1, and the
+      #   other way round
+      # - count the 8 neighbours of all the cells of the row at once,
+      #   as a 4-bit number spread over the words s0 (lowest bit) to
+      #   s3 (highest bit); each neighbour is added with a chain of
+      #   half adders
+      s0 = np.uint64(0)
+      s1 = np.uint64(0)
+      s2 = np.uint64(0)
+      s3 = np.uint64(0)
+      for neighbour in (((above << one) | (above >> last)) & mask, above,
+                        (above >> one) | ((above & one) << last),
+                        ((here << one) | (here >> last)) & mask,
+                        (here >> one) | ((here & one) << last),
+                        ((below << one) | (below >> last)) & mask, below,
+                        (below >> one) | ((below & one) << last)):
+        carry0 = s0 & neighbour
+        s0 ^= neighbour
+        carry1 = s1 & carry0
+        s1 ^= carry0
+        carry2 = s2 & carry1
+        s2 ^= carry1
+        s3 |= carry2
+      # - apply the rule to each possible number of neighbours
+      new_row = np.uint64(0)
+      for n in range(9):
+        count_n = mask
+        count_n &= s0 if (n & 1) else ~s0
+        count_n &= s1 if (n & 2) else ~s1
+        count_n &= s2 if (n & 4) else ~s2
+        count_n &= s3 if (n & 8) else ~s3
+        if birth_table[n]:
+          new_row |= count_n & ~here
+        if survival_table[n]:
+          new_row |= count_n & here
+      new_rows[i] = new_row & mask
+    rows[:] = new_rows
+#
+# Given a seed matrix, let it grow and measure the fitness of the
+# adult, without making an adult matrix: the seed is written as bits
+# in out, the adult's 60 packed rows (see "pack_rows()"), it grows
+# there with "run_life()", and the packed rows are compared with the
+# target. The output is [black_on_black, black_on_white].
+#
+def grow_and_score(seed_matrix, num_steps, adult_size, target_rows,
+                   target_not_rows, out):
+  # - position the seed in the center of the grid, as "grow_matrix()"
+  #   does on the Golly screen
+  seed_offset = int(len(seed_matrix) / 2)
+  box_offset  = int(adult_size / 2)
+  live_cells  = np.argwhere(seed_matrix == black) + (box_offset - seed_offset)
+  out[:] = 0
+  set_bits(out, live_cells[:, 0], live_cells[:, 1])
+  # - grow the seed
+  run_life(out, num_steps, birth_table, survival_table)
+  return compare(out, target_rows, target_not_rows, adult_size)
 #
-def mutate_seed(seed_matrix, prob_mutation):
-  # - each colour is assigned an ID number
-  white  = 0
-  black  = 1
+# Given a seed matrix, swap some of the colours (white, black).
+# This is a simple random mutation of the seed, and the compiled loop
+# behind select_and_mutate(). Given uniform random numbers for the
+# mutation coin and the switch coin of each cell, write the mutated
+# seed_matrix into new_matrix. Each cell of new_matrix depends only on
+# the same cell of seed_matrix, so new_matrix may be seed_matrix itself.
+#
+@njit
+def mutate_cells(seed_matrix, flip_u, coin_u, prob_mutation, new_matrix):
   # - get seed_matrix size
-  rows = len(seed_matrix)
-  cols = len(seed_matrix[0])
-  new_matrix = np.zeros([rows, cols], dtype=int)
+  rows = seed_matrix.shape[0]
+  cols = seed_matrix.shape[1]
   for i in range(rows):
     for j in range(cols):
-      # - change some cells
-      if (rand.random() < prob_mutation):
-        # - if currently white, then switch to black
-        if (seed_matrix[i][j] == white):
-          if (rand.random() < 0.5):
-            new_matrix[i][j] = black
-        # - if currently black, then switch to white
-        else:
-          if (rand.random() < 0.5):
-            new_matrix[i][j] = white
-      # - otherwise don't change
+      # - change some cells: a changed cell switches to the other
+      #   colour when its coin is below 0.5
+      if (flip_u[i, j] < prob_mutation) and (coin_u[i, j] < 0.5):
+        new_matrix[i, j] = other_colour[seed_matrix[i, j]]
+      # - otherwise don't change (this includes a changed cell whose
+      #   coin is not below 0.5: it keeps its colour)
       else:
-        new_matrix[i][j] = seed_matrix[i][j]
-  # - output the new matrix
-  return new_matrix
+        new_matrix[i, j] = seed_matrix[i, j]
+#
+# Take the random numbers for one birth from the pool, refilling
+# the pool when it is used up. The output is [sample, flip_u, coin_u],
+# where sample holds sample_size + 2 random positions in the
+# population and flip_u and coin_u are seed_size x seed_size
+# matrices of uniform random numbers.
+#
+def next_random_numbers(population_size, sample_size, seed_size):
+  global sample_pool, uniform_pool, pool_index
+  # - refill the pool
+  if (pool_index >= pool_size):
+    sample_pool  = rng.integers(0, population_size,
+                     (pool_size, sample_size + 2))
+    uniform_pool = rng.random((pool_size, 2, seed_size, seed_size),
+                     dtype=np.float32)
+    pool_index   = 0
+  # - use up the random numbers for one birth
+  sample  = sample_pool[pool_index]
+  flip_u  = uniform_pool[pool_index, 0]
+  coin_u  = uniform_pool[pool_index, 1]
+  pool_index += 1
+  return [sample, flip_u, coin_u]
 #
 # Sample a fraction of the population (e.g., 20%) and make a copy 
-# of the most fit member of the sample. Mutate the copy. Remove the
-# least fit member of the population and insert the mutated seed in
-# its place.
+# of the most fit member of the sample. Mutate the copy. Replace the
+# seed of the least fit member of the sample with the mutated seed,
+# in place in seeds. The output is least_fit_pos, the position of
+# the new seed; its adult and fitness are left for the caller.
 #
-def mutate_and_select_seed(population, sample_size, target, prob_mutation):
+def mutate_and_select_seed(seeds, fits, population_size, sample_size,
+                           prob_mutation):
   # - we have two things going on here:
   #
   # - (1) mutation: random mutations introduce new varieties of seeds
@@ -257,69 +443,238 @@ def mutate_and_select_seed(population, sample_size, target, prob_mutation):
   #   will take longer to achieve good results
   # - TO TURN OFF SELECTION: set sample_size = 0
   #
-  # - "population" is a list of lists
-  # - find the size of the population (e.g., 1000)
-  # - population consists of about 1000 triples, where each
-  #   triple has the form [[seed, adult, target], ..., [seed, adult, target]]
-  population_size = len(population)
+  # - the population is stored as parallel arrays:
+  #   seeds[k] is the seed matrix and fits[k] is the fitness of
+  #   the k-th member of the population
+  # - population_size is the size of the population (e.g., 1000);
+  #   it is constant, so the caller passes it in
   # - sample_size should be smaller than population_size (e.g., 20)
   assert (sample_size <= population_size)
   assert (sample_size >= 0)
-  # - each member of the population is a triple: 
-  #   [seed, adult, target]
-  # - sample a subset of the population (sample_size) and locate
-  #   the least fit and most fit members of the subset
-  least_fit_pos = rand.randrange(population_size)
-  least_fit_val = population[least_fit_pos][2] # [2] = target
-  most_fit_pos  = rand.randrange(population_size)
-  most_fit_val  = population[most_fit_pos][2] # [2] = target
-  # - now we're looking at sample_size different triples, but, in the
-  #   end, we only want to use two of the triples
-  for i in range(sample_size):
-    pos = rand.randrange(population_size)
-    val = population[pos][2]
-    if (val < least_fit_val):
-      least_fit_val = val
+  # - sample a subset of the population (sample_size + 2 positions)
+  #   and take the random numbers for the mutation coins and the
+  #   switch coins of every cell, all from the pool
+  seed_size = seeds.shape[1]
+  [sample, flip_u, coin_u] = next_random_numbers(population_size,
+                               sample_size, seed_size)
+  # - select and mutate in one compiled pass
+  least_fit_pos = select_and_mutate(fits, seeds, sample, flip_u, coin_u,
+                    prob_mutation)
+  # - output the position of the new seed
+  return least_fit_pos
+#
+# The compiled kernel behind mutate_and_select_seed(). Given the sampled
+# positions and the random numbers for the mutation coins, locate the
+# least fit and most fit members of the sample, write a mutated copy
+# of the most fit seed over the least fit seed, and return the least
+# fit position.
+#
+@njit
+def select_and_mutate(fits, seeds, sample, flip_u, coin_u, prob_mutation):
+  # - locate the least fit and most fit members of the sample
+  # - the search for the least fit starts from sample[0] and the
+  #   search for the most fit from sample[1], and both go on through
+  #   the other sample_size positions
+  least_fit_pos = sample[0]
+  most_fit_pos  = sample[1]
+  for k in range(2, len(sample)):
+    pos = sample[k]
+    if (fits[pos] < fits[least_fit_pos]):
       least_fit_pos = pos
-    if (val > most_fit_val):
-      most_fit_val = val
+    if (fits[pos] > fits[most_fit_pos]):
       most_fit_pos = pos
-  # - leave the most_fit triple as it is
-  # - modify the least_fit triple as follows:
-  # - (1) copy most_fit triple into least_fit triple
-  # - in the triple, we only consider the seed, because the adult 
-  #   and the target can be reconstructed from the seed
-  population[least_fit_pos][0] = population[most_fit_pos][0] # seed matrix
-  # - (2) use mutate_seed(seed_matrix, prob_mutation) to mutate
-  #       least_fit triple (now a copy of most_fit triple)
-  seed_matrix = population[least_fit_pos][0]
-  seed_matrix = mutate_seed(seed_matrix, prob_mutation)
-  # - output the new seed
-  return seed_matrix
+  # - leave the most_fit member as it is, unless it is also the
+  #   least_fit member (the same position was drawn twice, and all
+  #   of the sample is equally fit)
+  # - write the mutated copy of the most_fit seed straight into the
+  #   least_fit seed, with no temporary matrix
+  # - we only consider the seed, because the adult and the fitness
+  #   can be reconstructed from the seed
+  mutate_cells(seeds[most_fit_pos], flip_u, coin_u, prob_mutation,
+    seeds[least_fit_pos])
+  return least_fit_pos
+#
+# One birth: mutate and select a seed, grow it, and measure its
+# fitness. The new seed is written into seeds and the packed rows of
+# the new adult into adults, so no new matrices are made. The output
+# is the position of the new organism.
+#
+def breed_one(seeds, adults, fits, population_size, sample_size,
+              prob_mutation, num_steps, adult_size, target_rows,
+              target_not_rows):
+  # - run one tournament on a sample of the population: the mutated
+  #   copy of the most fit member of the sample replaces the seed of
+  #   the least fit member of the sample
+  position = mutate_and_select_seed(seeds, fits, population_size,
+               sample_size, prob_mutation)
+  # - grow the new seed directly into adults[position] and measure
+  #   the fitness of the new adult
+  [black_on_black, black_on_white] = grow_and_score(seeds[position],
+                                       num_steps, adult_size, target_rows,
+                                       target_not_rows, adults[position])
+  fits[position] = black_on_black - black_on_white
+  # - output the position of the new organism
+  return position
+#
+# Let the population evolve for num_births births. With each birth,
+# a newly born seed grows to adult size and replaces the least fit
+# organism of a sample. The output is the new position of the most
+# fit organism, given its position best_pos before the births.
+# first_birth is the number of births before these births, for the
+# progress messages.
+#
+def evolve_population(seeds, adults, fits, best_pos, num_births,
+                      target_rows, target_not_rows, first_birth):
+  # - this loop runs up to a million times, so the functions and the
+  #   settings that it uses are bound to local names, which Python
+  #   looks up faster than global names
+  breed      = breed_one
+  argmax     = fits.argmax
+  pop_size   = population_size
+  samp_size  = sample_size
+  p_mutation = prob_mutation
+  steps      = num_steps
+  size       = adult_size
+  show       = golly.show
+  #
+  for new_birth in range(num_births):
+    # - breed a new organism in the place of the least fit member
+    #   of a sample of the population
+    position = breed(seeds, adults, fits, pop_size, samp_size, p_mutation,
+                 steps, size, target_rows, target_not_rows)
+    # - update the position of the most fit organism
+    if (fits[position] > fits[best_pos]):
+      best_pos = position
+    elif (position == best_pos):
+      # - the most fit organism was replaced by a less fit one, so
+      #   look for the new most fit organism
+      best_pos = int(argmax())
+    # - the births make no Golly calls, and Golly only redraws its
+    #   window and checks for the Escape key and the Stop button
+    #   during a Golly call, so show the progress every show_births
+    #   births; this also lets the run be stopped
+    if (new_birth % show_births == 0):
+      show("birth " + str(first_birth + new_birth) +
+           "  best fitness " + str(fits[best_pos]))
+  #
+  return best_pos
+#
+# Migration among islands: save the most fit seed of this island for
+# the next island, and replace the least fit organism of this island
+# with the most fit seed of the previous island, if it has saved one.
+# The output is the new position of the most fit organism.
+#
+def migrate(seeds, adults, fits, best_pos, target_rows,
+            target_not_rows):
+  # - emigration: write to a temporary file and then rename it, so the
+  #   next island never reads a half-written seed
+  file_name = island_file_name(island_number)
+  with open(file_name + ".tmp", "wb") as seed_file:
+    np.save(seed_file, seeds[best_pos])
+  try:
+    os.replace(file_name + ".tmp", file_name)
+  except PermissionError:
+    # - on Windows, the file cannot be replaced while the next island
+    #   is reading it; skip this emigration, and the next migration
+    #   will send a newer seed
+    pass
+  # - immigration
+  file_name = island_file_name((island_number - 1) % num_islands)
+  if not os.path.exists(file_name):
+    return best_pos
+  immigrant = np.load(file_name)
+  # - ignore a seed of another size, such as a seed left over from an
+  #   earlier run with a different seed_size
+  if (immigrant.shape != seeds.shape[1:]):
+    return best_pos
+  position  = int(fits.argmin())
+  seeds[position] = immigrant
+  [black_on_black, black_on_white] = grow_and_score(seeds[position],
+                                       num_steps, adult_size, target_rows,
+                                       target_not_rows, adults[position])
+  fits[position] = black_on_black - black_on_white
+  # - update the position of the most fit organism
+  if (fits[position] > fits[best_pos]):
+    best_pos = position
+  elif (position == best_pos):
+    # - the most fit organism was replaced by a less fit immigrant
+    #   (all of the population was equally fit), so look for the new
+    #   most fit organism
+    best_pos = int(fits.argmax())
+  return best_pos
 #
 #
 # TARGETS
 # =======
 #
+# A 60 x 60 matrix of colours can be packed into 60 unsigned 64-bit
+# words, one word per row: bit j of word i is 1 when matrix[i, j] is
+# black. The 4 highest bits of each word are always 0.
+#
+def pack_rows(matrix):
+  rows = len(matrix)
+  # - packbits makes 8 bytes per row of 60 cells, lowest bit first,
+  #   and the 8 bytes are then read as one little-endian word
+  packed = np.packbits(matrix, axis=1, bitorder="little")
+  return packed.view("<u8").reshape(rows)
+#
+# The 60 low bits of a packed row, which hold the cells.
+#
+row_mask = np.uint64((1 << 60) - 1)
+#
+# Set bits in packed rows: for each k, set the bit for column
+# cell_cols[k] in the word for row cell_rows[k].
+#
+@njit
+def set_bits(rows, cell_rows, cell_cols):
+  for k in range(len(cell_rows)):
+    rows[cell_rows[k]] |= np.uint64(1) << np.uint64(cell_cols[k])
+#
+# Count the 1 bits in a 64-bit word. The bits are added in pairs,
+# then in groups of 4, then in bytes, and the multiplication adds
+# the 8 bytes together into the top byte.
+#
+@njit
+def count_bits(word):
+  word = word - ((word >> np.uint64(1)) & np.uint64(0x5555555555555555))
+  word = ((word & np.uint64(0x3333333333333333)) +
+          ((word >> np.uint64(2)) & np.uint64(0x3333333333333333)))
+  word = (word + (word >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+  return np.int64((word * np.uint64(0x0101010101010101)) >> np.uint64(56))
+#
+# The compiled loop behind compare(): given the packed rows of the
+# adult, of the target, and of the inverse of the target, count
+# black-on-black and black-on-white.
+#
+@njit
+def count_overlaps(adult_rows, target_rows, target_not_rows):
+  black_on_black = 0
+  black_on_white = 0
+  for i in range(len(adult_rows)):
+    black_on_black += count_bits(adult_rows[i] & target_rows[i])
+    black_on_white += count_bits(adult_rows[i] & target_not_rows[i])
+  return (black_on_black, black_on_white)
+#
 # Given two matrices, measure how much they agree. The first
 # matrix will be an organism that will be tested to see how
 # fit it is. The other matrix will be a target that is used
-# to measure the fitness of the first matrix.
-#
-def compare(adult, target, adult_size):
-  # adult and target are both 60x60 matrices
+# to measure the fitness of the first matrix. Both are given
+# packed into 60 words: adult_rows = pack_rows(adult), or the rows
+# set by "grow_and_score()", and target_rows = pack_rows(target),
+# along with the packed white cells of the target,
+# target_not_rows = ~target_rows & row_mask. The target does not
+# change during a run, so its rows are computed once.
+#
+def compare(adult_rows, target_rows, target_not_rows, adult_size):
+  # adult_rows, target_rows and target_not_rows each hold 60 packed
+  # rows
   # adult_size = 60
   assert adult_size == 60
-  rows = adult_size
-  cols = adult_size
   #
-  white = 0 # as a colour here, white is represented as 0
-  black = 1 # as a colour here, black is represented as 1
+  # - as a colour here, white is represented as 0 and black as 1
   #
-  assert (len(adult)     == 60)
-  assert (len(adult[0])  == 60)
-  assert (len(target)    == 60)
-  assert (len(target[0]) == 60)
+  assert (len(adult_rows)  == 60)
+  assert (len(target_rows) == 60)
   #
   # - compare the adult matrix and the target matrix
   # - for each square in the adult matrix, we look for the
@@ -331,18 +686,11 @@ def compare(adult, target, adult_size):
   #   adult matrix has a black square but the target matrix 
   #   has a white square in the corresponding position
   #
-  black_on_black = 0
-  black_on_white = 0
+  # - with the rows packed into words, each count is 60 word-wide
+  #   ANDs followed by a count of the 1 bits, in one compiled loop
   #
-  for i in range(rows):
-    for j in range(cols):
-      # - increment black_on_black
-      if ((adult[i, j] == black) and (target[i, j] == black)):
-        black_on_black += 1
-      # - increment black_on_white
-      if ((adult[i, j] == black) and (target[i, j] == white)):
-        black_on_white += 1
-      #
+  [black_on_black, black_on_white] = count_overlaps(adult_rows, target_rows,
+                                       target_not_rows)
   #
   # - the larger that black_on_black is and the smaller that
   #   black_on_white is, the greater the fitness
@@ -359,7 +707,7 @@ def compare(adult, target, adult_size):
 def show_target(matrix, adult_size):
   # - make a box of adult_size x adult_size centered on the origin
   # - golly.setcell(x, y, state) -- x is horizontal, y is vertical
-  # - matrix[i][j] -- i is rows (vertical), j is cols horizontal
+  # - matrix[i, j] -- i is rows (vertical), j is cols horizontal
   # - therefore we need to swap i and j, to rotate the image
   # - NOTE: if we divide a 60x60 grid into four quadrants:
   # - the top left quadrant ranges horizontally from -30 to -1
@@ -375,15 +723,14 @@ def show_target(matrix, adult_size):
   #
   assert adult_size == 60
   #
-  height = 60
-  width  = 60
-  #
-  for i in range(height):
-    for j in range(width):
-      # - for the matrix, i and j range from 0 to 59
-      colour = matrix[i, j]
-      # - for golly, j and i range from -30 to +29
-      golly.setcell(j + top, i + left, colour)
+  # - the screen starts out white, so only the black cells are
+  #   written, with one call to golly.putcells
+  # - for the matrix, i and j range from 0 to 59
+  # - for golly, j and i range from -30 to +29
+  black_cells = np.argwhere(matrix == black)
+  cell_list   = np.column_stack([black_cells[:, 1] + top,
+                                 black_cells[:, 0] + left])
+  golly.putcells(cell_list.ravel().tolist())
   return
 #
 # The following targets assume a size of 60 x 60
@@ -398,17 +745,11 @@ def show_target(matrix, adult_size):
 def target_1():
   rows = 60
   cols = 60
-  matrix_1 = np.zeros([rows, cols], dtype=int)
-  for i in range(rows):
-    for j in range(cols):
-      if (j >= 0) and (j < 30) and (i >= 0) and (i < 30):
-        matrix_1[i, j] = black
-      if (j >= 0) and (j < 30) and (i >= 30) and (i < 60):
-        matrix_1[i, j] = white
-      if (j >= 30) and (j < 60) and (i >= 0) and (i < 30):
-        matrix_1[i, j] = white
-      if (j >= 30) and (j < 60) and (i >= 30) and (i < 60):
-        matrix_1[i, j] = black
+  matrix_1 = np.zeros([rows, cols], dtype=np.int8)
+  matrix_1[0:30, 0:30]   = black
+  matrix_1[30:60, 0:30]  = white
+  matrix_1[0:30, 30:60]  = white
+  matrix_1[30:60, 30:60] = black
   return matrix_1
 #
 # Target 2
@@ -419,13 +760,9 @@ def target_1():
 def target_2():
   rows = 60
   cols = 60
-  matrix_2 = np.zeros([rows, cols], dtype=int)
-  for i in range(rows):
-    for j in range(cols):
-      if (j >= 0) and (j < 30):
-        matrix_2[i, j] = black
-      if (j >= 30) and (j < 60):
-        matrix_2[i, j] = white
+  matrix_2 = np.zeros([rows, cols], dtype=np.int8)
+  matrix_2[:, 0:30]  = black
+  matrix_2[:, 30:60] = white
   return matrix_2
 #
 # Target 3
@@ -436,17 +773,10 @@ def target_2():
 def target_3():
   rows = 60
   cols = 60
-  matrix_3 = np.zeros([rows, cols], dtype=int)
-  rows = 60
-  cols = 60
-  for i in range(rows):
-    for j in range(cols):
-      if (j >= 0) and (j < 20):
-        matrix_3[i, j] = white
-      if (j >= 20) and (j < 40):
-        matrix_3[i, j] = black
-      if (j >= 40) and (j < 60):
-        matrix_3[i, j] = white
+  matrix_3 = np.zeros([rows, cols], dtype=np.int8)
+  matrix_3[:, 0:20]  = white
+  matrix_3[:, 20:40] = black
+  matrix_3[:, 40:60] = white
   return matrix_3
 #
 # Target 4
@@ -457,19 +787,12 @@ def target_3():
 def target_4():
   rows = 60
   cols = 60
-  matrix_4 = np.zeros([rows, cols], dtype=int)
-  for i in range(rows):
-    for j in range(cols):
-      if (j >= 0) and (j < 10):   # 10 white
-        matrix_4[i, j] = white
-      if (j >= 10) and (j < 25):  # 15 black
-        matrix_4[i, j] = black
-      if (j >= 25) and (j < 35):  # 10 white
-        matrix_4[i, j] = white
-      if (j >= 35) and (j < 50):  # 15 black
-        matrix_4[i, j] = black
-      if (j >= 50) and (j < 60):  # 10 white
-        matrix_4[i, j] = white
+  matrix_4 = np.zeros([rows, cols], dtype=np.int8)
+  matrix_4[:, 0:10]  = white  # 10 white
+  matrix_4[:, 10:25] = black  # 15 black
+  matrix_4[:, 25:35] = white  # 10 white
+  matrix_4[:, 35:50] = black  # 15 black
+  matrix_4[:, 50:60] = white  # 10 white
   return matrix_4
 #
 # Target 5
@@ -489,35 +812,18 @@ def target_4():
 def target_5():
   rows = 60
   cols = 60
-  matrix_5 = np.zeros([rows, cols], dtype=int)
-  # - top left
-  for i in range(30):
-    for j in range(30):
-      if (i >= j):
-        matrix_5[i, 29 - j] = black
-      else:
-        matrix_5[i, 29 - j] = white
-  # - top right
-  for i in range(30):
-    for j in range(30):
-      if (i >= j):
-        matrix_5[i, 30 + j] = black
-      else:
-        matrix_5[i, 30 + j] = white
-  # - bottom left
-  for i in range(30):
-    for j in range(30):
-      if (i > j):
-        matrix_5[30 + i, 29 - j] = white
-      else:
-        matrix_5[30 + i, 29 - j] = black
-  # - bottom right
-  for i in range(30):
-    for j in range(30):
-      if (i > j):
-        matrix_5[30 + i, 30 + j] = white
-      else:
-        matrix_5[30 + i, 30 + j] = black
+  matrix_5 = np.zeros([rows, cols], dtype=np.int8)
+  # - i and j index the cells of a 30 x 30 quadrant
+  i, j = np.indices((30, 30))
+  # - top half: black on and below the diagonal (i >= j)
+  top_half    = np.where(i >= j, black, white)
+  # - bottom half: white below the diagonal (i > j)
+  bottom_half = np.where(i > j, white, black)
+  # - the left quadrants are mirror images of the right quadrants
+  matrix_5[0:30, 0:30]   = top_half[:, ::-1]     # top left
+  matrix_5[0:30, 30:60]  = top_half              # top right
+  matrix_5[30:60, 0:30]  = bottom_half[:, ::-1]  # bottom left
+  matrix_5[30:60, 30:60] = bottom_half           # bottom right
   #
   return matrix_5
 #
@@ -533,8 +839,20 @@ golly.new(rule_name)
 # - a torus is finite, which means the live cells should
 #   be packed more densely and uniformly, which is good
 golly.setrule(rule_name)
+# - the seeds are grown by run_life() rather than by Golly during the
+#   run, so read the rule once
+[birth_table, survival_table] = parse_rule(rule_name, adult_size)
 # - the population size is fixed at population_size
-population = []
+# - the population is stored as three parallel arrays, so that
+#   selection can work on the fitnesses alone:
+#   seeds[k]  = seed matrix of the k-th organism
+#   adults[k] = packed rows of the adult grown from seeds[k]
+#   fits[k]   = fitness of adults[k]
+# - the adults are one contiguous array of 60 packed rows per adult
+#   (see "pack_rows()"), 480 bytes per adult
+seeds  = np.zeros([population_size, seed_size, seed_size], dtype=np.int8)
+adults = np.zeros([population_size, adult_size], dtype=np.uint64)
+fits   = np.zeros(population_size, dtype=np.int32)
 # - set the target for determining fitness
 # - the fitness of an organism is determined by how well it
 #   matches with the given target
@@ -559,9 +877,20 @@ if (target_number == 4):
 if (target_number == 5):
   target = target_5()
   target_name = "target_5()"
-log_file = open("./log_file" + str(target_number) + ".txt", "a+")
 log_file.write("\ntarget = " + str(target_name) + "\n\n")
-log_file.close()
+log_file.flush()
+# - the target does not change during the run, so pack its black
+#   rows and its white rows once, for compare()
+target_rows     = pack_rows(target)
+target_not_rows = ~target_rows & row_mask
+# - compile the Numba kernels behind grow_and_score() now, with an
+#   empty adult, rather than at the first comparison
+set_bits(np.zeros(adult_size, dtype=np.uint64), np.zeros(0, dtype=int),
+  np.zeros(0, dtype=int))
+compare(np.zeros(adult_size, dtype=np.uint64), target_rows,
+  target_not_rows, adult_size)
+run_life(np.zeros(adult_size, dtype=np.uint64), 1, birth_table,
+  survival_table)
 ##############################################################
 #
 # - create generation zero
@@ -575,93 +904,80 @@ log_file.close()
 # - SELECTION = organisms are tested independently and reproduction
 #   is asexual, so selection can only be based on the match with the
 #   fitness measure -- matching a target shape
+# - make all the random seed matrices for generation zero at once:
+#   sample_size seeds for each of the population_size organisms
+# - "seed_size" determines the size of the square seed (e.g., 20 or 40)
+seed_batch = make_seed_batch(population_size * sample_size,
+               prob_white, prob_black, seed_size)
+seed_batch = seed_batch.reshape([population_size, sample_size,
+               seed_size, seed_size])
+scratch_adult = np.zeros(adult_size, dtype=np.uint64)
 for individual in range(population_size):
   # - randomly sample a small number of seed matrices
   # - sample_size is defined at the top of this file
-  sample_set = []
-  # - collect sample_size samples and then extract the best sample
+  # - collect sample_size samples and keep the best sample so far,
+  #   with a single comparison per sample
+  best_fitness = None
   for sample in range(sample_size):
-    # - "seed_size" determines the size of the square seed (e.g., 20 or 40)
-    seed = make_seed_matrix(prob_black, prob_white, seed_size)
+    seed = seed_batch[individual, sample]
     # - grow the matrix -- adult_size = 60 = size of the 60x60 matrix
-    adult = grow_matrix(seed, num_steps, adult_size)
     # - measure how well the adult matches with the target
-    [black_on_black, black_on_white] = compare(adult, target, adult_size)
+    # - every sample is grown into the same scratch rows, and only
+    #   the best sample is copied into adults
+    [black_on_black, black_on_white] = grow_and_score(seed, num_steps,
+                                         adult_size, target_rows,
+                                         target_not_rows, scratch_adult)
     fitness = black_on_black - black_on_white
-    # - append sample
-    sample_set.append([seed, adult, fitness])
-  # - sort the list (sample_set) by the third element (fitness)
-  sorted_samples = sorted(sample_set, key=lambda tup: tup[2])
-  # - best_sample is the last tuple in the list of sorted_samples
-  best_sample = sorted_samples[-1]
-  # - store the vector [seed, adult, target]
-  population.append(best_sample) 
+    # - store the best sample as the next organism
+    if (best_fitness is None) or (fitness > best_fitness):
+      best_fitness       = fitness
+      seeds[individual]  = seed
+      adults[individual] = scratch_adult
+  fits[individual] = best_fitness
+  # - show the progress, which also lets Golly redraw its window and
+  #   lets the run be stopped (see "evolve_population()")
+  golly.show("generation zero: organism " + str(individual + 1) +
+             " of " + str(population_size))
+# - the seeds that were kept have been copied into seeds
+del seed_batch
+#
+# - keep track of the position of the most fit organism as the
+#   population evolves
+best_pos = int(fits.argmax())
 #
 #
 # - now we let the population evolve
 # - with each step, we add a newly born seed and let it grow
 #   to adult size
 # - then we replace the least fit organism with the new organism
-for new_birth in range(max_births):
-  # - randomly select two adults from the population
-  # - an organism has the form [seed, adult, target]
-  position1 = rand.randrange(population_size)
-  position2 = rand.randrange(population_size)
-  organism1 = population[position1] # [seed, adult, target]
-  organism2 = population[position2] # [seed, adult, target]
-  fitness1  = organism1[2] # fitness
-  fitness2  = organism2[2] # fitness
-  seed1     = organism1[0] # seed
-  seed2     = organism2[0] # seed
-  # - make a copy of the more fit organism and mutate it
-  # - then replace the less fit organism with the mutant
-  if (fitness1 > fitness2):
-    # - fitness1 is better than fitness2, so keep [seed1, adult1, fitness1]
-    # - population[position1] = organism1 = [seed1, adult1, fitness1]
-    # - fitness2 is worse than fitness1, so replace fitness2 with a
-    #   mutated version of fitness1
-    seed2 = mutate_and_select_seed(population, sample_size, target, prob_mutation)
-    # - grow the new seed
-    adult2 = grow_matrix(seed2, num_steps, adult_size)
-    # - fitness of the new adult
-    [black_on_black2, black_on_white2] = compare(adult2, target, adult_size)
-    fitness2 = black_on_black2 - black_on_white2
-    # - place the new individual where the less fit individual was
-    population[position2] = [seed2, adult2, fitness2]
-  # - otherwise, if (fitness1 < fitness2) then replace the less fit 
-  #   organism with the new mutant
-  else:
-    # - fitness1 is worse than fitness2, so keep [seed2, adult2, fitness2]
-    # - population[position2] = organism2 = [seed2, adult2, fitness2]
-    # - fitness1 is better than fitness2, so replace fitness2 with a
-    #   mutated version of fitness1
-    seed1 = mutate_and_select_seed(population, sample_size, target, prob_mutation)
-    # - grow the new seed
-    adult1 = grow_matrix(seed1, num_steps, adult_size)
-    # - fitness of the new adult
-    [black_on_black1, black_on_white1] = compare(adult1, target, adult_size)
-    fitness1 = black_on_black1 - black_on_white1
-    # - place the new individual where the less fit individual was
-    population[position1] = [seed1, adult1, fitness1]
-    #
+# - with several islands, the births are split into rounds of
+#   migration_births births, with a migration after each round
+if (num_islands == 1):
+  best_pos = evolve_population(seeds, adults, fits, best_pos, max_births,
+               target_rows, target_not_rows, 0)
+else:
+  births_so_far = 0
+  while (births_so_far < max_births):
+    num_births = min(migration_births, max_births - births_so_far)
+    best_pos = evolve_population(seeds, adults, fits, best_pos, num_births,
+                 target_rows, target_not_rows, births_so_far)
+    births_so_far += num_births
+    best_pos = migrate(seeds, adults, fits, best_pos, target_rows,
+                 target_not_rows)
 #
 #
 # - report the best fitness
-# - start with the first fitness
-log_file = open("./log_file" + str(target_number) + ".txt", "a+")
+# - the position of the most fit organism was tracked during the
+#   run, so only the best adult needs to be compared with the
+#   target again
 log_file.write("\n")
-best_fitness_so_far = 0
-for k in range(population_size):
-  [seed, adult, fitness] = population[k]
-  [black_on_black, black_on_white] = compare(adult, target, adult_size)
-  fitness = black_on_black - black_on_white
-  if (fitness > best_fitness_so_far):
-    best_fitness_so_far = fitness
-    best_seed_so_far  = seed
-    best_adult_so_far = adult
-    log_file.write(str(k) + " fitness " + str(fitness) + "\n")
-    log_file.write(str(k) + " black_on_black " + str(black_on_black) + "\n")
-    log_file.write(str(k) + " black_on_white " + str(black_on_white) + "\n")
+best_seed_so_far  = seeds[best_pos]
+best_adult_so_far = adults[best_pos]
+[black_on_black, black_on_white] = compare(best_adult_so_far, target_rows,
+                                     target_not_rows, adult_size)
+log_file.write(str(best_pos) + " fitness " + str(fits[best_pos]) + "\n")
+log_file.write(str(best_pos) + " black_on_black " + str(black_on_black) + "\n")
+log_file.write(str(best_pos) + " black_on_white " + str(black_on_white) + "\n")
 log_file.write("\n")
 log_file.close()
 #
@@ -677,24 +993,24 @@ log_file.close()
 golly.new("")
 show_target(target, adult_size)
 golly.setmag(3)
-golly.setname("photo_target" + str(target_number))
-golly.save("photo_target" + str(target_number) + ".rle", "rle", False)
+golly.setname("photo_target" + run_name)
+golly.save("photo_target" + run_name + ".rle", "rle", False)
 #
 # - show seed (20x20)
 # - golly.setcell(x, y, state) -- x is horizontal, y is vertical
-# - best_seed_so_far[i][j] -- i is rows (vertical), j is cols horizontal
+# - best_seed_so_far[i, j] -- i is rows (vertical), j is cols horizontal
 # - therefore we need to swap i and j, to rotate the image
+# - the screen starts out white, so only the black cells are written,
+#   with one call to golly.putcells
 golly.new("")
-rows = seed_size
-cols = seed_size
 halfway = int(seed_size / 2)                # 20/2 = 10 or 40/2 = 20
-for i in range(rows):
-  for j in range(cols):
-    colour = best_seed_so_far[i][j]
-    golly.setcell(j - halfway, i - halfway, colour)
+black_cells = np.argwhere(best_seed_so_far == black)
+cell_list   = np.column_stack([black_cells[:, 1] - halfway,
+                               black_cells[:, 0] - halfway])
+golly.putcells(cell_list.ravel().tolist())
 golly.setmag(3)
-golly.setname("photo_seed" + str(target_number))
-golly.save("photo_seed" + str(target_number) + ".rle", "rle", False)
+golly.setname("photo_seed" + run_name)
+golly.save("photo_seed" + run_name + ".rle", "rle", False)
 #
 # - show adult (60x60)
 # - write top_adult to the screen
@@ -702,8 +1018,8 @@ golly.new("")
 grown_matrix = grow_matrix(best_seed_so_far, num_steps, adult_size)
 show_target(grown_matrix, adult_size)
 golly.setmag(3)
-golly.setname("photo_adult" + str(target_number))
-golly.save("photo_adult" + str(target_number) + ".rle", "rle", False)
+golly.setname("photo_adult" + run_name)
+golly.save("photo_adult" + run_name + ".rle", "rle", False)
 #
 #
 #
\ No newline at end of file